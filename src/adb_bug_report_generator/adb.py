@@ -1,9 +1,16 @@
 """ADB client abstraction."""
 
+import posixpath
+import queue
 import re
 import shlex
+import shutil
 import subprocess
-from dataclasses import dataclass
+import tarfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from adb_bug_report_generator.exceptions import (
@@ -44,6 +51,101 @@ class DeviceRecord:
     state: str
 
 
+class AdbShellSession:
+    """Long-lived ``adb shell`` process that runs commands one at a time."""
+
+    def __init__(self, args, timeout_seconds=None):
+        self.args = list(args)
+        self.timeout_seconds = timeout_seconds
+        self.lock = threading.Lock()
+        self._sentinel = f"__adb_bug_report_done_{uuid.uuid4().hex}__"
+        self._process = subprocess.Popen(
+            self.args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        )
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump_stdout, daemon=True).start()
+
+    def run(self, command):
+        """Run one command in the session and return ``(stdout, returncode)``."""
+        try:
+            self._process.stdin.write(
+                f"sh -c {shlex.quote(command)} 2>/dev/null </dev/null; __rc=$?; "
+                f"echo; echo {self._sentinel}$__rc\n"
+            )
+            self._process.stdin.flush()
+        except OSError as exc:
+            raise AdbCommandError("ADB shell session ended unexpectedly.", self.args) from exc
+
+        deadline = None if self.timeout_seconds is None else time.monotonic() + self.timeout_seconds
+        output = []
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty as exc:
+                raise AdbTimeoutError(
+                    f"ADB command timed out after {self.timeout_seconds} seconds.",
+                    self.args + [command],
+                    self.timeout_seconds,
+                ) from exc
+            if line is None:
+                raise AdbCommandError("ADB shell session ended unexpectedly.", self.args)
+            if line.startswith(self._sentinel):
+                # Drop the newline added by the bare ``echo`` before the sentinel.
+                return "".join(output)[:-1], int(line[len(self._sentinel) :])
+            output.append(line)
+
+    def close(self):
+        """Stop the shell process."""
+        try:
+            self._process.stdin.close()
+            self._process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+
+    def _pump_stdout(self):
+        try:
+            for line in self._process.stdout:
+                self._lines.put(line)
+        finally:
+            # Always wake up a waiting ``run`` call, even if reading the pipe failed.
+            self._lines.put(None)
+
+
+class AdbBackgroundCommand:
+    """``adb`` process started without waiting, so callers can overlap it or abandon it."""
+
+    def __init__(self, client, args):
+        self.client = client
+        self.args = list(args)
+        self._process = client._popen(self.args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    def wait(self):
+        """Wait for the command to finish and return its structured result."""
+        _, stderr = self._process.communicate()
+        stderr = (stderr or b"").decode("utf-8", errors="replace").strip()
+        if self._process.returncode:
+            raise self.client._map_command_error(self.args, stderr)
+        return ADBCommandResult(
+            command=tuple(str(part) for part in self.args),
+            stdout="",
+            stderr=stderr,
+            returncode=self._process.returncode,
+        )
+
+    def terminate(self):
+        """Kill the command if it is still running."""
+        if self._process.poll() is None:
+            self._process.kill()
+            self._process.communicate()
+
+
 @dataclass
 class ADBClient:
     """ADB client with timeout, retry, and structured command support."""
@@ -51,6 +153,11 @@ class ADBClient:
     executable: str = "adb"
     timeout_seconds: float | None = None
     retry_attempts: int = 1
+    persistent_shell: bool = False
+    _sessions: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _sessions_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def list_devices(self):
         """Return connected device serials."""
@@ -109,15 +216,25 @@ class ADBClient:
 
     def run_shell_command(self, command, device=None, allow_failure=False):
         """Run an ADB shell command and return a cleaned structured result."""
-        args = self._device_prefix(device) + ["shell", f"sh -c {shlex.quote(command)}"]
-        result = self._run(args, allow_failure=allow_failure)
+        args = self._device_prefix(device) + ["shell", command]
+        result = self._run_in_session(args, command, device, allow_failure) or self._run(
+            args, allow_failure=allow_failure
+        )
         return ADBCommandResult(
             command=result.command,
-            stdout=ANSI_ESCAPE_PATTERN.sub("", result.stdout.strip()),
+            stdout=_strip_ansi(result.stdout.strip()),
             stderr=result.stderr.strip(),
             returncode=result.returncode,
         )
 
+    def stream_shell_command_to_file(self, command, output_path, device=None, allow_failure=False):
+        """Run a device command and stream its raw stdout straight into a local file."""
+        # exec-out never allocates a PTY, so pre-shell_v2 devices keep their LF line endings.
+        remote_command = f"{{ {command}; }} 2>/dev/null"
+        args = self._device_prefix(device) + ["exec-out", remote_command]
+        with open(output_path, "wb") as output_file:
+            return self._run(args, allow_failure=allow_failure, stdout=output_file)
+
     def shell_text(self, command, device=None):
         """Backwards-compatible helper for callers that only need stdout text."""
         return self.run_shell_command(command, device=device).stdout
@@ -139,7 +256,47 @@ class ADBClient:
     def pull_directory(self, remote_path, local_dir, device=None):
         """Pull a directory from the target device to a local directory."""
         Path(local_dir).mkdir(parents=True, exist_ok=True)
-        return self.pull_file(remote_path, local_dir, device=device)
+        args = self._device_prefix(device) + ["pull", remote_path, str(local_dir)]
+        return self._run(args, retryable=True, timeout_seconds=None)
+
+    def stream_files(self, remote_dir, targets, device=None):
+        """Stream named top-level files through one tar archive; return the names written."""
+        names = " ".join(shlex.quote(f"./{name}") for name in targets)
+        remote_command = f"tar -cf - -C {shlex.quote(remote_dir)} {names} 2>/dev/null"
+        args = self._device_prefix(device) + ["exec-out", remote_command]
+        written = set()
+        process = self._popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        reader = _ActivityReader(process.stdout)
+        stop_watchdog = threading.Event()
+        if self.timeout_seconds is not None:
+            threading.Thread(
+                target=_kill_when_idle,
+                args=(process, reader, self.timeout_seconds, stop_watchdog),
+                daemon=True,
+            ).start()
+
+        with process:
+            partial_path = None
+            try:
+                with tarfile.open(fileobj=reader, mode="r|") as archive:
+                    for member in archive:
+                        name = posixpath.normpath(member.name)
+                        local_path = targets.get(name)
+                        if local_path is None or not member.isfile():
+                            continue
+                        partial_path = local_path
+                        with open(local_path, "wb") as destination:
+                            shutil.copyfileobj(archive.extractfile(member), destination)
+                        partial_path = None
+                        written.add(name)
+            except (tarfile.TarError, OSError):
+                process.kill()
+                if partial_path is not None:
+                    Path(partial_path).unlink(missing_ok=True)
+            finally:
+                stop_watchdog.set()
+
+        return written
 
     def pull(self, remote_path, local_path, device=None):
         """Backwards-compatible alias for file or directory pulls."""
@@ -150,27 +307,118 @@ class ADBClient:
         args = self._device_prefix(device) + ["bugreport", str(output_path)]
         return self._run(args, retryable=True, timeout_seconds=None)
 
+    def start_bugreport(self, output_path, device=None):
+        """Start ``adb bugreport`` in the background and return its ``AdbBackgroundCommand``."""
+        args = self._device_prefix(device) + ["bugreport", str(output_path)]
+        return AdbBackgroundCommand(self, args)
+
     def bugreport(self, output_path, device=None):
         """Backwards-compatible alias for bugreport collection."""
         return self.collect_bugreport(output_path, device=device)
 
     def collect_logcat(self, output_path, device=None, command="logcat -d"):
-        """Collect logcat text and write it to a local file."""
-        result = self.run_shell_command(command, device=device)
-        Path(output_path).write_text(result.stdout, encoding="utf-8")
-        return result
+        """Stream logcat output to a local file; the returned result has empty ``stdout``."""
+        return self.stream_shell_command_to_file(command, output_path, device=device)
 
     def get_device_info(self, commands, device=None):
         """Run one or more device-info shell commands and return structured results."""
         return [self.run_shell_command(command, device=device) for command in commands]
 
+    def close(self):
+        """Close any persistent shell sessions."""
+        with self._sessions_lock:
+            sessions = [session for session in self._sessions.values() if session is not None]
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def _run_in_session(self, args, command, device, allow_failure):
+        """Run through the device's idle persistent shell; ``None`` means fall back."""
+        session = self._get_session(device) if self.persistent_shell else None
+        if session is None or not session.lock.acquire(blocking=False):
+            return None
+
+        try:
+            stdout, returncode = session.run(command)
+        except AdbTimeoutError:
+            self._discard_session(device, session)
+            raise
+        except AdbCommandError:
+            self._discard_session(device, session)
+            return None
+        finally:
+            session.lock.release()
+
+        if returncode and not allow_failure:
+            return None
+        return ADBCommandResult(
+            command=tuple(args),
+            stdout=stdout,
+            stderr="",
+            returncode=returncode,
+        )
+
+    def _get_session(self, device):
+        with self._sessions_lock:
+            if device in self._sessions:
+                return self._sessions[device]
+
+        session = None
+        if self._supports_shell_v2(device):
+            try:
+                session = AdbShellSession(
+                    self._device_prefix(device) + ["shell"], self.timeout_seconds
+                )
+            except OSError:
+                session = None
+
+        with self._sessions_lock:
+            current = self._sessions.setdefault(device, session)
+        if current is not session and session is not None:
+            session.close()
+        return current
+
+    def _supports_shell_v2(self, device):
+        """Return whether adbd on the device offers the PTY-free shell protocol."""
+        try:
+            result = self._run(self._device_prefix(device) + ["features"], allow_failure=True)
+        except (AdbCommandError, AdbTimeoutError):
+            return False
+        return result.returncode == 0 and "shell_v2" in result.stdout.replace(",", " ").split()
+
+    def _discard_session(self, device, session):
+        """Stop a broken session and keep later calls for the device on one-shot processes."""
+        with self._sessions_lock:
+            self._sessions[device] = None
+        session.close()
+
+    def _popen(self, args, **kwargs):
+        try:
+            return subprocess.Popen(args, **kwargs)
+        except FileNotFoundError as exc:
+            raise AdbCommandError(
+                (
+                    "ADB executable not found. Install Android Platform Tools and ensure 'adb' "
+                    "is available on your PATH."
+                ),
+                args,
+                exit_code=4,
+            ) from exc
+
     def _device_prefix(self, device):
         args = [self.executable]
         if device:
             args.extend(["-s", device])
         return args
 
-    def _run(self, args, retryable=False, allow_failure=False, timeout_seconds=DEFAULT_TIMEOUT):
+    def _run(
+        self,
+        args,
+        retryable=False,
+        allow_failure=False,
+        timeout_seconds=DEFAULT_TIMEOUT,
+        stdout=subprocess.PIPE,
+    ):
         attempts = 1 + self.retry_attempts if retryable else 1
         last_error = None
         effective_timeout = (
@@ -182,13 +430,14 @@ class ADBClient:
                 completed = subprocess.run(
                     args,
                     text=True,
-                    capture_output=True,
+                    stdout=stdout,
+                    stderr=subprocess.PIPE,
                     check=True,
                     timeout=effective_timeout,
                 )
                 return ADBCommandResult(
                     command=tuple(str(part) for part in completed.args),
-                    stdout=completed.stdout,
+                    stdout=completed.stdout or "",
                     stderr=completed.stderr,
                     returncode=completed.returncode,
                 )
@@ -272,6 +521,34 @@ class ADBClient:
         )
 
 
+class _ActivityReader:
+    """File-like wrapper that records when data last arrived from a stream."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.last_activity = time.monotonic()
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.last_activity = time.monotonic()
+        return data
+
+
+def _kill_when_idle(process, reader, timeout_seconds, stop):
+    """Kill ``process`` once ``reader`` has received nothing for ``timeout_seconds``."""
+    while not stop.wait(min(timeout_seconds, 1.0)):
+        if time.monotonic() - reader.last_activity > timeout_seconds:
+            process.kill()
+            return
+
+
+def _strip_ansi(text):
+    """Remove ANSI color codes, skipping the regex scan when no escape byte is present."""
+    if "\x1b" not in text:
+        return text
+    return ANSI_ESCAPE_PATTERN.sub("", text)
+
+
 def _parse_int(value):
     try:
         return int(value)
@@ -1,7 +1,11 @@
 """CLI entry point."""
 
 import argparse
+import logging
 import shlex
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from adb_bug_report_generator.adb import ADBClient
 from adb_bug_report_generator.collector import (
@@ -10,16 +14,17 @@ from adb_bug_report_generator.collector import (
     CollectionOptions,
     build_recent_file_commands,
     build_run_summary,
-    collect_bugreport,
     collect_logs,
     collect_package_diagnostics,
     collect_protected_path_diagnostics,
     evaluate_requested_collectors,
     filter_log_specs,
     get_application_directories,
+    list_recent_files,
     pull_directory,
     pull_recent_files,
     select_device,
+    start_bugreport,
 )
 from adb_bug_report_generator.compatibility import detect_device_profile, profile_to_metadata
 from adb_bug_report_generator.exceptions import (
@@ -35,10 +40,10 @@ from adb_bug_report_generator.filesystem import (
     cleanup_report_dir,
     create_report_paths,
     create_zip_archive,
+    render_json,
+    sanitize_filename_component,
     sanitize_metadata_text,
     validate_output_root,
-    write_json_file,
-    write_text_file,
 )
 from adb_bug_report_generator.logging_config import setup_logging
 
@@ -52,6 +57,14 @@ def parse_args():
         "--device",
         help="Use a specific connected device serial instead of prompting.",
     )
+    parser.add_argument(
+        "--all-devices",
+        action="store_true",
+        help=(
+            "Collect from every connected device concurrently, writing each report under "
+            "a per-device subdirectory of the output directory."
+        ),
+    )
     parser.add_argument(
         "-n",
         "--num-recent-files",
@@ -153,23 +166,42 @@ def format_operator_error(exc):
     return str(exc)
 
 
-def main(args=None, logger=None, client=None, prompt=input, device_prompt=input):
+def main(args=None, logger=None, client=None, prompt=input, device_prompt=input, require_tty=False):
     """Run the CLI workflow."""
-    args = args or parse_args()
+    if args is None:
+        # Console runs prompt on stdin, so they must not block when it is not a terminal.
+        args = parse_args()
+        require_tty = True
     logger = logger or setup_logging(verbose=args.verbose)
 
     try:
-        return run(args, logger, client=client, prompt=prompt, device_prompt=device_prompt)
+        return run(
+            args,
+            logger,
+            client=client,
+            prompt=prompt,
+            device_prompt=device_prompt,
+            require_tty=require_tty,
+        )
     except ADBBugReportError as exc:
         logger.error(format_operator_error(exc))
         return getattr(exc, "exit_code", 1)
 
 
-def run(args, logger, client=None, prompt=input, device_prompt=input):
+def run(args, logger, client=None, prompt=input, device_prompt=input, require_tty=False):
     """Orchestrate a collection run."""
     _validate_cli_inputs(args)
-    client = client or ADBClient(timeout_seconds=args.timeout)
-    paths = create_report_paths(args.output_dir)
+    if client is not None:
+        return _run_collection(args, logger, client, prompt, device_prompt, require_tty)
+
+    client = ADBClient(timeout_seconds=args.timeout, persistent_shell=True)
+    try:
+        return _run_collection(args, logger, client, prompt, device_prompt, require_tty)
+    finally:
+        client.close()
+
+
+def _run_collection(args, logger, client, prompt, device_prompt, require_tty):
     options = CollectionOptions(
         num_recent_files=args.num_recent_files,
         simplified=args.simplified,
@@ -186,13 +218,56 @@ def run(args, logger, client=None, prompt=input, device_prompt=input):
         allow_emulator=args.allow_emulator,
         require_root=args.require_root,
         compat_mode=args.compat_mode,
+        all_devices=getattr(args, "all_devices", False),
     )
 
     device_records = _list_device_records(client)
     devices = _resolve_ready_devices(device_records)
-    selected_device = _resolve_selected_device(options, devices, device_prompt, logger)
+    if options.all_devices:
+        return _collect_all_devices(args, options, logger, client, devices, prompt)
+
+    selected_device = _resolve_selected_device(options, devices, device_prompt, logger, require_tty)
     logger.info("Selected device: %s", selected_device)
+    return _collect_from_device(
+        args,
+        options,
+        logger,
+        client,
+        selected_device,
+        create_report_paths(args.output_dir),
+        lambda: _resolve_incident_summary(options, prompt, logger),
+    )
+
+
+def _collect_all_devices(args, options, logger, client, devices, prompt):
+    """Run one collection per connected device concurrently and return the worst exit code."""
+    user_summary = _resolve_incident_summary(options, prompt, logger)
+    logger.info("Collecting from all connected devices: %s", ", ".join(devices))
+
+    def collect(device):
+        device_logger = _DeviceLoggerAdapter(logger, {"device": device})
+        try:
+            paths = create_report_paths(Path(args.output_dir) / sanitize_filename_component(device))
+            return _collect_from_device(
+                args, options, device_logger, client, device, paths, lambda: user_summary
+            )
+        except ADBBugReportError as exc:
+            device_logger.error(format_operator_error(exc))
+            return getattr(exc, "exit_code", 1)
 
+    with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+        exit_codes = list(executor.map(collect, devices))
+    return max(exit_codes)
+
+
+class _DeviceLoggerAdapter(logging.LoggerAdapter):
+    """Prefix log lines with the device serial so concurrent collections stay distinguishable."""
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['device']}] {msg}", kwargs
+
+
+def _collect_from_device(args, options, logger, client, selected_device, paths, resolve_summary):
     device_profile = detect_device_profile(client, selected_device)
     logger.info(
         (
@@ -218,62 +293,40 @@ def run(args, logger, client=None, prompt=input, device_prompt=input):
     if not app_directories:
         logger.info("No valid application directories found.")
 
-    user_summary = _resolve_incident_summary(options, prompt, logger)
+    user_summary = resolve_summary()
     artifact_results = []
 
-    if not options.simplified:
-        for directory in DIRECTORIES_TO_PULL:
-            artifact_results.extend(
-                pull_directory(
-                    client, directory, paths.report_dir, selected_device, output=logger.info
-                )
-            )
-
-    for directory, ls_command in recent_file_commands:
-        artifact_results.extend(
-            pull_recent_files(
-                client,
-                directory,
-                ls_command,
-                paths.report_dir,
-                options.num_recent_files,
-                selected_device,
-                paths,
-                output=logger.info,
-            )
+    pending_bugreport = None
+    if options.include_bugreport and not options.simplified:
+        # adb bugreport takes minutes on-device, so it runs while everything else is collected.
+        pending_bugreport = start_bugreport(
+            client,
+            paths.report_dir,
+            selected_device,
+            device_profile,
+            output=logger.info,
         )
 
-    if log_specs:
+    try:
         artifact_results.extend(
-            collect_logs(
+            _collect_device_artifacts(
+                options,
+                logger,
                 client,
                 selected_device,
                 paths,
                 device_profile,
-                output=logger.info,
-                log_specs=log_specs,
-            )
-        )
-    else:
-        artifact_results.append(
-            ArtifactResult(
-                name="diagnostics",
-                status="skipped",
-                detail="Logcat and device-info collection were both disabled for this run.",
+                log_specs,
+                recent_file_commands,
             )
         )
+        if pending_bugreport is not None:
+            artifact_results.append(pending_bugreport.result())
+    finally:
+        if pending_bugreport is not None:
+            pending_bugreport.cancel()
 
-    if options.include_bugreport and not options.simplified:
-        artifact_results.append(
-            collect_bugreport(
-                client,
-                paths.report_dir,
-                selected_device,
-                device_profile,
-                output=logger.info,
-            )
-        )
-    else:
+    if pending_bugreport is None:
         artifact_results.append(
             ArtifactResult(
                 name="bugreport",
@@ -304,7 +357,6 @@ def run(args, logger, client=None, prompt=input, device_prompt=input):
     )
 
     run_summary = build_run_summary(artifact_results)
-    write_text_file(paths.report_dir / "run_summary.txt", run_summary)
 
     metadata = {
         "incident_summary": sanitize_metadata_text(user_summary),
@@ -327,14 +379,21 @@ def run(args, logger, client=None, prompt=input, device_prompt=input):
             "allow_emulator": options.allow_emulator,
             "require_root": options.require_root,
             "compat_mode": options.compat_mode,
+            "all_devices": options.all_devices,
             "output_dir": sanitize_metadata_text(args.output_dir),
         },
         "artifacts": [result.to_metadata() for result in artifact_results],
     }
-    write_json_file(paths.report_dir / "metadata.json", metadata)
 
     zip_file_name = paths.incident_dir / f"QA_bug_report_{paths.timestamp}.zip"
-    create_zip_archive(paths.report_dir, zip_file_name)
+    create_zip_archive(
+        paths.report_dir,
+        zip_file_name,
+        extra_entries={
+            "run_summary.txt": run_summary,
+            "metadata.json": render_json(metadata),
+        },
+    )
     logger.info("Incident report created: %s", zip_file_name)
 
     try:
@@ -350,7 +409,69 @@ def run(args, logger, client=None, prompt=input, device_prompt=input):
     return 0
 
 
-def _resolve_selected_device(options, devices, device_prompt, logger):
+def _collect_device_artifacts(
+    options, logger, client, selected_device, paths, device_profile, log_specs, recent_file_commands
+):
+    """Pull directories and recent files and collect text logs for one device."""
+    use_archive = device_profile.available_commands.get("tar", False)
+    results = []
+
+    if not options.simplified:
+        for directory in DIRECTORIES_TO_PULL:
+            results.extend(
+                pull_directory(
+                    client,
+                    directory,
+                    paths.report_dir,
+                    selected_device,
+                    output=logger.info,
+                    use_archive=use_archive,
+                )
+            )
+
+    recent_listings = (
+        list_recent_files(client, recent_file_commands, options.num_recent_files, selected_device)
+        or {}
+    )
+    for directory, ls_command in recent_file_commands:
+        results.extend(
+            pull_recent_files(
+                client,
+                directory,
+                ls_command,
+                paths.report_dir,
+                options.num_recent_files,
+                selected_device,
+                paths,
+                output=logger.info,
+                use_archive=use_archive,
+                recent_files=recent_listings.get(directory),
+            )
+        )
+
+    if log_specs:
+        results.extend(
+            collect_logs(
+                client,
+                selected_device,
+                paths,
+                device_profile,
+                output=logger.info,
+                log_specs=log_specs,
+            )
+        )
+    else:
+        results.append(
+            ArtifactResult(
+                name="diagnostics",
+                status="skipped",
+                detail="Logcat and device-info collection were both disabled for this run.",
+            )
+        )
+    return results
+
+
+def _resolve_selected_device(options, devices, device_prompt, logger, require_tty=False):
     if options.device:
         if options.device not in devices:
             raise InvalidDeviceSelectionError(
@@ -366,9 +487,19 @@ def _resolve_selected_device(options, devices, device_prompt, logger):
             "or an explicit --device value."
         )
 
+    if require_tty and len(devices) > 1 and not _stdin_is_interactive():
+        raise InvalidDeviceSelectionError(
+            "Multiple devices are connected but stdin is not interactive. "
+            "Pass --device or --all-devices."
+        )
+
     return select_device(devices, prompt=device_prompt, output=logger.info)
 
 
+def _stdin_is_interactive():
+    return sys.stdin is not None and sys.stdin.isatty()
+
+
 def _resolve_incident_summary(options, prompt, logger):
     if options.incident_summary is not None:
         return sanitize_metadata_text(options.incident_summary)
@@ -387,6 +518,9 @@ def _validate_cli_inputs(args):
     except ValueError as exc:
         raise InvalidDeviceSelectionError(str(exc)) from exc
 
+    if getattr(args, "all_devices", False) and args.device:
+        raise InvalidDeviceSelectionError("--all-devices cannot be combined with --device.")
+
     if args.package and not _is_safe_package_name(args.package):
         raise InvalidDeviceSelectionError(
             "Package name contains unsupported characters. Use a standard Android package id."
@@ -1,11 +1,15 @@
 """Collection workflow and orchestration."""
 
+import posixpath
 import shlex
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from adb_bug_report_generator.exceptions import NoConnectedDevicesError
-from adb_bug_report_generator.filesystem import sanitize_filename_component
+from adb_bug_report_generator.filesystem import IO_BUFFER_SIZE, sanitize_filename_component
 
 DIRECTORIES_TO_PULL = [
     "/sdcard/Pictures",
@@ -23,6 +27,11 @@ ROOT_DIAGNOSTIC_COMMANDS = (
     ("recent_tombstones", "su -c 'ls -t /data/tombstones 2>/dev/null | head -n 5'"),
 )
 
+RECENT_LISTING_MARKER = "__adb_bug_report_listing__:"
+
+MAX_PULL_WORKERS = 8
+MAX_LOG_WORKERS = 8
+
 LOG_SPECS = (
     ("logcat", "logcat.txt", ("logcat -d",), "logcat"),
     ("device_info", "device_info.txt", ("getprop", "dumpsys window"), "getprop_or_dumpsys"),
@@ -41,6 +50,11 @@ LOG_SPECS = (
     ("event_logs", "event_logs.txt", ("dumpsys activity",), "dumpsys"),
 )
 
+# Requirements whose outputs can run to megabytes; these are streamed to disk as raw bytes.
+# Small outputs such as ``top`` and ``df`` keep the decoded path, which strips the ANSI
+# escapes toybox emits even without a TTY.
+STREAMED_LOG_REQUIREMENTS = frozenset({"logcat", "getprop_or_dumpsys", "dumpsys"})
+
 LEGACY_COMMAND_OVERRIDES = {
     "cpu_usage": ("top -n 1 -m 10", "top -n 1"),
     "storage_info": ("df", "df -h"),
@@ -94,6 +108,7 @@ class CollectionOptions:
     allow_emulator: bool = False
     require_root: bool = False
     compat_mode: str = "auto"
+    all_devices: bool = False
 
 
 @dataclass
@@ -139,14 +154,17 @@ def select_device(devices, prompt=input, output=None):
         output("Invalid choice. Please try again.")
 
 
-def get_application_directories(client, device):
-    """Check which application directories exist on the target device."""
-    existing_dirs = []
-    for dir_path in APPLICATION_DIRECTORIES:
-        result = _shell_result(client, f"test -d '{dir_path}' && echo exists", device)
-        if result == "exists":
-            existing_dirs.append(dir_path)
-    return existing_dirs
+def get_application_directories(client, device, directories=APPLICATION_DIRECTORIES):
+    """Check which application directories exist on the target device in one shell call."""
+    result = _shell_result(client, build_directory_probe_command(directories), device)
+    found = set(result.splitlines()) if result else set()
+    return [dir_path for dir_path in directories if dir_path in found]
+
+
+def build_directory_probe_command(directories):
+    """Return a shell loop that echoes each of the given paths that is a directory."""
+    quoted = " ".join(shlex.quote(dir_path) for dir_path in directories)
+    return f'for d in {quoted}; do [ -d "$d" ] && echo "$d"; done'
 
 
 def build_recent_file_commands(app_directories):
@@ -162,101 +180,102 @@ def build_recent_file_commands(app_directories):
     return commands
 
 
-def pull_directory(client, directory, dest_dir, device, output=None):
+def list_recent_files(client, recent_file_commands, num_files, device):
+    """List recent files for every directory in one shell call, or return ``None``."""
+    script = "; ".join(
+        f"echo {shlex.quote(RECENT_LISTING_MARKER + directory)}; "
+        f"{ls_command} | head -n {num_files}"
+        for directory, ls_command in recent_file_commands
+    )
+    result = _shell_result(client, script, device) if script else ""
+    if not result.startswith(RECENT_LISTING_MARKER):
+        return None
+
+    listings = {}
+    directory = None
+    for line in result.splitlines():
+        if line.startswith(RECENT_LISTING_MARKER):
+            directory = line[len(RECENT_LISTING_MARKER) :]
+            listings[directory] = []
+        elif line and directory is not None:
+            listings[directory].append(line)
+    return {directory: "\n".join(lines) for directory, lines in listings.items()}
+
+
+def pull_directory(client, directory, dest_dir, device, output=None, use_archive=False):
     """Pull top-level files and subdirectories from a device directory."""
     output = output or _noop
     local_dir = Path(dest_dir) / Path(directory).name
     local_dir.mkdir(parents=True, exist_ok=True)
-    results = []
 
     items = _shell_result(client, f"ls -p {directory}", device)
     if not items:
         output(f"No items found in {directory}")
-        return results
-
-    for item in items.splitlines():
-        if ".thumbnails" in item:
-            continue
-        if directory == "/sdcard/Movies" and item.startswith("screen-"):
-            continue
-
+        return []
+
+    listed_items = [item for item in items.splitlines() if item]
+    kept_items = [item for item in listed_items if not _is_excluded_item(directory, item)]
+    if len(kept_items) == len(listed_items):
+        result = _pull_whole_directory(client, directory, dest_dir, local_dir, device, output)
+        if result is not None:
+            return [result]
+
+    tasks = []
+    file_tasks = []
+    for item in kept_items:
         item_path = f"{directory}/{item.rstrip('/')}"
         safe_name = sanitize_filename_component(item.rstrip("/"))
-        local_path = local_dir / safe_name
-        try:
-            client.pull_file(item_path, local_path, device=device)
-            output(f"Pulled {item_path} to {local_path}")
-            results.append(
-                ArtifactResult(
-                    name=f"pull:{item_path}",
-                    status="collected",
-                    path=str(local_path),
-                )
-            )
-        except Exception:
-            output(f"Failed to pull {item_path}")
-            results.append(
-                ArtifactResult(
-                    name=f"pull:{item_path}",
-                    status="failed",
-                    detail=f"Failed to pull {item_path}.",
-                )
-            )
+        tasks.append((item_path, local_dir / safe_name))
+        if not item.endswith("/"):
+            file_tasks.append(tasks[-1])
 
-    return results
+    streamed = _stream_files(client, directory, file_tasks, device) if use_archive else set()
+    return _pull_artifacts(
+        client, tasks, device, output, failure_label="Failed to pull", streamed=streamed
+    )
 
 
 def pull_recent_files(
-    client, directory, ls_command, dest_dir, num_files, device, report_paths, output=None
+    client,
+    directory,
+    ls_command,
+    dest_dir,
+    num_files,
+    device,
+    report_paths,
+    output=None,
+    use_archive=False,
+    recent_files=None,
 ):
     """Pull the most recent files from a specific device directory."""
     output = output or _noop
     output(f"Getting {num_files} most recent file(s) from {directory} on device {device}")
-    recent_files = _shell_result(client, f"{ls_command} | head -n {num_files}", device)
-    results = []
+    if recent_files is None:
+        recent_files = _shell_result(client, f"{ls_command} | head -n {num_files}", device)
 
     if not recent_files:
         output(f"No files found in {directory}")
-        return results
-
-    for recent_file in recent_files.splitlines():
-        safe_filename = sanitize_filename_component(recent_file)
-        file_path = f"{directory}/{recent_file}"
-
-        if "Movies" in directory and recent_file.startswith("screen-"):
-            local_path = report_paths.screen_recordings_dir / safe_filename
-        elif "ConsoleLogs" in directory:
-            local_path = report_paths.qgc_logs_dir / safe_filename
-        elif "Navsuite" in directory:
-            local_path = report_paths.navsuite_log_dir / safe_filename
-        else:
-            local_path = Path(dest_dir) / safe_filename
+        return []
 
-        try:
-            client.pull_file(file_path, local_path, device=device)
-            output(f"Pulled {file_path} to {local_path}")
-            results.append(
-                ArtifactResult(
-                    name=f"pull:{file_path}",
-                    status="collected",
-                    path=str(local_path),
-                )
-            )
-        except Exception:
-            output(f"Failed to pull file {file_path}")
-            results.append(
-                ArtifactResult(
-                    name=f"pull:{file_path}",
-                    status="failed",
-                    detail=f"Failed to pull file {file_path}.",
-                )
-            )
+    local_dir = _recent_file_destination(directory, dest_dir, report_paths)
+    tasks = [
+        (f"{directory}/{recent_file}", local_dir / sanitize_filename_component(recent_file))
+        for recent_file in recent_files.splitlines()
+    ]
 
-    return results
+    streamed = _stream_files(client, directory, tasks, device) if use_archive else set()
+    return _pull_artifacts(
+        client, tasks, device, output, failure_label="Failed to pull file", streamed=streamed
+    )
 
 
 def collect_bugreport(client, dest_dir, device, device_profile, output=None):
     """Collect a bugreport zip."""
+    return start_bugreport(client, dest_dir, device, device_profile, output=output).result()
+
+
+def start_bugreport(client, dest_dir, device, device_profile, output=None):
+    """Start bugreport collection in the background and return a ``PendingBugreport``."""
     output = output or _noop
     if not _supports_requirement(device_profile, "bugreport"):
         detail = (
@@ -264,70 +283,124 @@ def collect_bugreport(client, dest_dir, device, device_profile, output=None):
             "is unavailable on this device."
         )
         output(detail)
-        return ArtifactResult(name="bugreport", status="skipped", detail=detail)
+        return PendingBugreport(
+            result=ArtifactResult(name="bugreport", status="skipped", detail=detail)
+        )
 
     output("Generating bug report...")
-    bugreport_zip = Path(dest_dir) / "bugreport.zip"
-    try:
-        client.collect_bugreport(bugreport_zip, device=device)
-        output(f"Bug report saved to {bugreport_zip}")
-        return ArtifactResult(name="bugreport", status="collected", path=str(bugreport_zip))
-    except Exception:
-        detail = "Failed to generate bugreport."
-        output(detail)
-        return ArtifactResult(name="bugreport", status="failed", detail=detail)
+    return PendingBugreport(client, Path(dest_dir) / "bugreport.zip", device, output)
+
+
+class PendingBugreport:
+    """Bugreport collection running alongside the other artifacts."""
+
+    def __init__(self, client=None, bugreport_zip=None, device=None, output=None, result=None):
+        self._bugreport_zip = bugreport_zip
+        self._output = output or _noop
+        self._result = result
+        self._process = None
+        self._thread = None
+        self._error = None
+        if result is not None:
+            return
+
+        if hasattr(client, "start_bugreport"):
+            try:
+                self._process = client.start_bugreport(bugreport_zip, device=device)
+            except Exception as exc:
+                self._error = exc
+            return
+
+        def run_collection():
+            try:
+                client.collect_bugreport(bugreport_zip, device=device)
+            except Exception as exc:
+                self._error = exc
+
+        self._thread = threading.Thread(target=run_collection, daemon=True)
+        self._thread.start()
+
+    def result(self):
+        """Wait for the bugreport and return its ``ArtifactResult``."""
+        if self._result is not None:
+            return self._result
+
+        try:
+            if self._process is not None:
+                self._process.wait()
+            if self._thread is not None:
+                self._thread.join()
+            if self._error is not None:
+                raise self._error
+        except Exception:
+            detail = "Failed to generate bugreport."
+            self._output(detail)
+            self._result = ArtifactResult(name="bugreport", status="failed", detail=detail)
+            return self._result
+
+        self._output(f"Bug report saved to {self._bugreport_zip}")
+        self._result = ArtifactResult(
+            name="bugreport", status="collected", path=str(self._bugreport_zip)
+        )
+        return self._result
+
+    def cancel(self):
+        """Kill a bugreport process that is still running; a no-op once it has finished."""
+        if self._process is not None:
+            self._process.terminate()
 
 
 def collect_logs(client, device, report_paths, device_profile, output=None, log_specs=LOG_SPECS):
     """Collect text-based diagnostic artifacts using compatibility-aware fallbacks."""
     output = output or _noop
     results = []
-    for log_name, filename, commands, requirement in resolve_log_specs_for_profile(
-        device_profile, log_specs
-    ):
-        compatibility_reason = _compatibility_skip_reason(log_name, device_profile)
-        if compatibility_reason:
-            output(compatibility_reason)
-            results.append(
-                ArtifactResult(name=log_name, status="skipped", detail=compatibility_reason)
-            )
-            continue
+    pending = []
+
+    with ThreadPoolExecutor(max_workers=MAX_LOG_WORKERS) as executor:
+        for log_name, filename, commands, requirement in resolve_log_specs_for_profile(
+            device_profile, log_specs
+        ):
+            compatibility_reason = _compatibility_skip_reason(log_name, device_profile)
+            if compatibility_reason:
+                output(compatibility_reason)
+                results.append(
+                    ArtifactResult(name=log_name, status="skipped", detail=compatibility_reason)
+                )
+                continue
 
-        if not _supports_requirement(device_profile, requirement):
-            detail = (
-                f"Skipped {log_name} because the required command is unavailable on this device."
+            if not _supports_requirement(device_profile, requirement):
+                detail = (
+                    f"Skipped {log_name} because the required command "
+                    "is unavailable on this device."
+                )
+                output(detail)
+                results.append(ArtifactResult(name=log_name, status="skipped", detail=detail))
+                continue
+
+            output(f"Collecting {log_name}...")
+            log_path = report_paths.device_info_dir / filename
+            stream = requirement in STREAMED_LOG_REQUIREMENTS and hasattr(
+                client, "stream_shell_command_to_file"
             )
-            output(detail)
-            results.append(ArtifactResult(name=log_name, status="skipped", detail=detail))
-            continue
+            future = executor.submit(_collect_log_file, client, commands, device, log_path, stream)
+            pending.append((len(results), log_name, log_path, future))
+            results.append(None)
 
-        log_path = report_paths.device_info_dir / filename
-        output(f"Collecting {log_name}...")
-        used_command = None
-        result = ""
+        for index, log_name, log_path, future in pending:
+            used_command = future.result()
 
-        for command in commands:
-            result = _shell_result(client, command, device)
-            if result:
-                used_command = command
-                break
-
-        if result:
-            log_path.write_text(result, encoding="utf-8")
-            output(f"{log_name} saved to {log_path}")
-            detail = f"Collected using `{used_command}`." if used_command else ""
-            results.append(
-                ArtifactResult(
+            if used_command:
+                output(f"{log_name} saved to {log_path}")
+                results[index] = ArtifactResult(
                     name=log_name,
                     status="collected",
                     path=str(log_path),
-                    detail=detail,
+                    detail=f"Collected using `{used_command}`.",
                 )
-            )
-        else:
-            detail = f"No output returned for {log_name}."
-            output(detail)
-            results.append(ArtifactResult(name=log_name, status="failed", detail=detail))
+            else:
+                detail = f"No output returned for {log_name}."
+                output(detail)
+                results[index] = ArtifactResult(name=log_name, status="failed", detail=detail)
 
     return results
 
@@ -509,6 +582,128 @@ def build_run_summary(artifact_results):
     return "\n".join(lines) + "\n"
 
 
+def _collect_log_file(client, commands, device, log_path, stream=False):
+    """Write the first command in a fallback chain that produced output; return that command."""
+    for command in commands:
+        if stream:
+            client.stream_shell_command_to_file(
+                command, log_path, device=device, allow_failure=True
+            )
+            if _has_visible_content(log_path):
+                return command
+            continue
+
+        result = _shell_result(client, command, device)
+        if result:
+            log_path.write_text(result, encoding="utf-8")
+            return command
+
+    if stream:
+        log_path.unlink(missing_ok=True)
+    return None
+
+
+def _has_visible_content(path):
+    """Return whether a file holds anything besides whitespace."""
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(IO_BUFFER_SIZE), b""):
+            if chunk.strip():
+                return True
+    return False
+
+
+def _recent_file_destination(directory, dest_dir, report_paths):
+    """Return the local folder for recent files from a device directory."""
+    if "Movies" in directory:
+        return report_paths.screen_recordings_dir
+    if "ConsoleLogs" in directory:
+        return report_paths.qgc_logs_dir
+    if "Navsuite" in directory:
+        return report_paths.navsuite_log_dir
+    return Path(dest_dir)
+
+
+def _is_excluded_item(directory, item):
+    if ".thumbnails" in item:
+        return True
+    return directory == "/sdcard/Movies" and item.startswith("screen-")
+
+
+def _pull_whole_directory(client, directory, dest_dir, local_dir, device, output):
+    """Pull a directory with one adb invocation; ``None`` means fall back to per-item pulls."""
+    try:
+        client.pull_directory(directory, dest_dir, device=device)
+    except Exception:
+        shutil.rmtree(local_dir, ignore_errors=True)
+        local_dir.mkdir(parents=True, exist_ok=True)
+        return None
+
+    # ``ls -p`` never lists dot-entries, so drop what the per-item path would have skipped.
+    _remove_unlisted_entries(local_dir)
+    output(f"Pulled {directory} to {local_dir}")
+    return ArtifactResult(name=f"pull:{directory}", status="collected", path=str(local_dir))
+
+
+def _remove_unlisted_entries(local_dir):
+    """Delete top-level hidden entries and nested ``.thumbnails`` caches from a pulled tree."""
+    hidden = list(Path(local_dir).glob(".*"))
+    hidden.extend(path for path in Path(local_dir).rglob(".thumbnails") if path.is_dir())
+    for path in hidden:
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+
+
+def _stream_files(client, directory, tasks, device):
+    """Stream plain files through one tar archive and return the remote paths written."""
+    if not tasks or not hasattr(client, "stream_files"):
+        return set()
+
+    targets = {posixpath.basename(remote_path): local_path for remote_path, local_path in tasks}
+    try:
+        written = client.stream_files(directory, targets, device=device)
+    except Exception:
+        return set()
+    return {f"{directory}/{name}" for name in written}
+
+
+def _pull_artifacts(client, tasks, device, output, failure_label, streamed=frozenset()):
+    """Pull (remote, local) pairs concurrently and report results in listing order."""
+    if not tasks:
+        return []
+
+    def pull_one(task):
+        remote_path, local_path = task
+        if remote_path in streamed:
+            return f"Streamed {remote_path} to {local_path}", ArtifactResult(
+                name=f"pull:{remote_path}",
+                status="collected",
+                path=str(local_path),
+            )
+        try:
+            client.pull_file(remote_path, local_path, device=device)
+        except Exception:
+            message = f"{failure_label} {remote_path}"
+            return message, ArtifactResult(
+                name=f"pull:{remote_path}",
+                status="failed",
+                detail=f"{message}.",
+            )
+        return f"Pulled {remote_path} to {local_path}", ArtifactResult(
+            name=f"pull:{remote_path}",
+            status="collected",
+            path=str(local_path),
+        )
+
+    results = []
+    with ThreadPoolExecutor(max_workers=min(MAX_PULL_WORKERS, len(tasks))) as executor:
+        for message, result in executor.map(pull_one, tasks):
+            output(message)
+            results.append(result)
+    return results
+
+
 def _supports_requirement(device_profile, requirement):
     commands = COMMAND_REQUIREMENTS.get(requirement, tuple())
     if not commands:
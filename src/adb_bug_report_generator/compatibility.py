@@ -2,7 +2,7 @@
 
 from dataclasses import asdict, dataclass
 
-from adb_bug_report_generator.collector import APPLICATION_DIRECTORIES
+from adb_bug_report_generator.collector import get_application_directories
 
 KNOWN_COMMANDS = (
     "getprop",
@@ -12,6 +12,7 @@ KNOWN_COMMANDS = (
     "ifconfig",
     "ip",
     "top",
+    "tar",
 )
 
 
@@ -101,12 +102,7 @@ def detect_boot_completed(client, serial):
 
 
 def detect_accessible_paths(client, serial):
-    paths = []
-    for path in APPLICATION_DIRECTORIES:
-        exists = _probe_shell_text(client, f"test -d '{path}' && echo exists", serial)
-        if exists == "exists":
-            paths.append(path)
-    return paths
+    return get_application_directories(client, serial)
 
 
 def command_exists(client, command, serial):
@@ -1,8 +1,10 @@
 """Filesystem helpers for report creation."""
 
 import json
+import os
 import re
 import shutil
+import time
 import zipfile
 from dataclasses import dataclass
 from datetime import datetime
@@ -10,6 +12,15 @@ from pathlib import Path
 
 INVALID_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
 CONTROL_CHARS = re.compile(r"[\x00-\x1F\x7F]")
+IO_BUFFER_SIZE = 1 << 20
+# Logs compress well even at level 1, which is several times faster than zlib's default of 6.
+ZIP_COMPRESSLEVEL = 1
+# Already-compressed media and archives gain almost nothing from DEFLATE, so they are stored.
+# Mode that metadata.json and run_summary.txt had when written to disk under the usual umask.
+GENERATED_FILE_MODE = 0o100644
+STORED_SUFFIXES = frozenset(
+    {".mp4", ".mkv", ".mov", ".webm", ".jpg", ".jpeg", ".png", ".webp", ".zip", ".gz"}
+)
 
 
 @dataclass(frozen=True)
@@ -43,35 +54,38 @@ def create_report_paths(output_root="incident_reports"):
         timestamp=timestamp,
     )
 
+    # incident_dir exists at this point, so each level is a single mkdir with no parent walk.
+    paths.report_dir.mkdir(exist_ok=True)
     for path in (
-        paths.report_dir,
         paths.screen_recordings_dir,
         paths.qgc_logs_dir,
         paths.device_info_dir,
         paths.navsuite_log_dir,
     ):
-        path.mkdir(parents=True, exist_ok=True)
+        path.mkdir(exist_ok=True)
 
     return paths
 
 
-def write_text_file(path, content):
-    """Write text content to disk."""
-    path.write_text(content, encoding="utf-8")
+def render_json(content):
+    """Serialize JSON content the way report files store it."""
+    return json.dumps(content, indent=2, sort_keys=True)
 
 
-def write_json_file(path, content):
-    """Write JSON content to disk."""
-    path.write_text(json.dumps(content, indent=2, sort_keys=True), encoding="utf-8")
+def create_zip_archive(source_dir, output_filename, extra_entries=None):
+    """Create a zip archive of report files plus any generated ``extra_entries``."""
 
-
-def create_zip_archive(source_dir, output_filename):
-    """Create a zip archive containing report files."""
-
-    with zipfile.ZipFile(output_filename, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in source_dir.rglob("*"):
-            if file_path.is_file():
-                zipf.write(file_path, file_path.relative_to(source_dir))
+    with (
+        open(output_filename, "wb", buffering=IO_BUFFER_SIZE) as output_file,
+        zipfile.ZipFile(
+            output_file, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL
+        ) as zipf,
+    ):
+        for file_path, arcname, stat_result in _iter_report_files(source_dir):
+            _write_zip_entry(zipf, file_path, arcname, stat_result)
+        for arcname, content in (extra_entries or {}).items():
+            zinfo = _new_zip_info(zipf, arcname, time.localtime()[:6], GENERATED_FILE_MODE)
+            zipf.writestr(zinfo, content)
 
 
 def cleanup_report_dir(report_dir):
@@ -98,3 +112,37 @@ def validate_output_root(output_root):
     if path.exists() and not path.is_dir():
         raise ValueError(f"Output path '{path}' exists and is not a directory.")
     return path
+
+
+def _iter_report_files(directory, prefix=""):
+    """Yield ``(path, arcname, stat)`` for every file below ``directory``."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            arcname = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_report_files(entry.path, arcname + "/")
+            elif entry.is_file():
+                yield entry.path, arcname, entry.stat()
+
+
+def _new_zip_info(zipf, arcname, date_time, mode):
+    """Build a ``ZipInfo`` using the archive's compression settings."""
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (mode & 0xFFFF) << 16
+    zinfo.compress_type = zipf.compression
+    # ZipFile.open() and writestr() do not apply the archive's level to caller-built ZipInfo.
+    zinfo._compresslevel = zipf.compresslevel
+    return zinfo
+
+
+def _write_zip_entry(zipf, file_path, arcname, stat_result):
+    """Copy one file into the archive in large chunks."""
+    # Same header fields as ZipInfo.from_file, reusing the stat taken during enumeration.
+    zinfo = _new_zip_info(
+        zipf, arcname, time.localtime(stat_result.st_mtime)[:6], stat_result.st_mode
+    )
+    zinfo.file_size = stat_result.st_size
+    if os.path.splitext(arcname)[1].lower() in STORED_SUFFIXES:
+        zinfo.compress_type = zipfile.ZIP_STORED
+    with open(file_path, "rb") as source, zipf.open(zinfo, "w") as destination:
+        shutil.copyfileobj(source, destination, IO_BUFFER_SIZE)
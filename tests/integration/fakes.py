@@ -1,6 +1,12 @@
 """Shared fake collaborators for integration tests."""
 
 from dataclasses import dataclass
+from pathlib import Path
+
+from adb_bug_report_generator.collector import (
+    APPLICATION_DIRECTORIES,
+    build_directory_probe_command,
+)
 
 
 @dataclass(frozen=True)
@@ -25,11 +31,7 @@ class FakeADBClient:
 
     def shell_text(self, command, device=None):
         responses = {
-            (
-                "test -d '/sdcard/Android/data/org.mavlink.qgroundcontrol/files/PDW_GCS' "
-                "&& echo exists"
-            ): "",
-            "test -d '/sdcard/Android/data/ai.pdw.gcs/files/PDW_GCS' && echo exists": "",
+            build_directory_probe_command(APPLICATION_DIRECTORIES): "",
             "getprop ro.product.model": "Pixel 8",
             "getprop ro.product.manufacturer": "Google",
             "getprop ro.build.version.release": "14",
@@ -67,7 +69,7 @@ class FakeADBClient:
 
     def run_shell_command(self, command, device=None):
         return FakeCommandResult(
-            command=("adb", "shell", "sh", "-c", command),
+            command=("adb", "shell", command),
             stdout=self.shell_text(command, device=device),
         )
 
@@ -86,7 +88,11 @@ class FakeADBClient:
         self.pull(remote_path, local_path, device=device)
 
     def pull_directory(self, remote_path, local_dir, device=None):
-        self.pull(remote_path, local_dir, device=device)
+        self.pulled.append((remote_path, str(local_dir), device))
+
+        destination = Path(local_dir) / remote_path.split("/")[-1]
+        destination.mkdir(parents=True, exist_ok=True)
+        (destination / "pulled.txt").write_text(f"pulled from {remote_path}", encoding="utf-8")
 
     def bugreport(self, output_path, device=None):
         output_path.write_text("bugreport", encoding="utf-8")
@@ -1,12 +1,15 @@
 """Integration tests for CLI orchestration with a fake ADB client."""
 
+import io
 import json
 import logging
+import threading
 from types import SimpleNamespace
 from zipfile import ZipFile
 
+from adb_bug_report_generator import cli
 from adb_bug_report_generator.cli import format_operator_error, main, run
-from adb_bug_report_generator.exceptions import AdbCommandError
+from adb_bug_report_generator.exceptions import AdbCommandError, AdbTimeoutError
 from tests import _bootstrap  # noqa: F401
 from tests.integration.fakes import (
     BootingEmulatorADBClient,
@@ -27,6 +30,7 @@ from tests.integration.fakes import (
 def build_args(tmp_path, **overrides):
     defaults = {
         "device": None,
+        "all_devices": False,
         "num_recent_files": 2,
         "simplified": True,
         "include_logcat": True,
@@ -125,6 +129,59 @@ def test_run_includes_bugreport_when_requested(tmp_path):
         assert "bugreport.zip" in archive_names
 
 
+def test_run_collects_bugreport_concurrently_with_other_artifacts(tmp_path):
+    args = build_args(tmp_path, simplified=False, include_bugreport=True)
+    logger = logging.getLogger("test_cli_bugreport_overlap")
+    logcat_collected = threading.Event()
+
+    class SlowBugreportADBClient(FakeADBClient):
+        def shell_text(self, command, device=None):
+            if command == "logcat -d":
+                logcat_collected.set()
+            return super().shell_text(command, device=device)
+
+        def bugreport(self, output_path, device=None):
+            # Only finishes if log collection runs while the bugreport is in flight.
+            if not logcat_collected.wait(timeout=5):
+                raise RuntimeError("bugreport blocked log collection")
+            super().bugreport(output_path, device=device)
+
+    exit_code = run(args, logger, client=SlowBugreportADBClient(), prompt=lambda _: "summary")
+
+    assert exit_code == 0
+
+    zip_files = list((tmp_path / "output").glob("QA_bug_report_*.zip"))
+    with ZipFile(zip_files[0]) as archive:
+        assert "bugreport.zip" in archive.namelist()
+        metadata = json.loads(archive.read("metadata.json").decode("utf-8"))
+        bugreport = next(item for item in metadata["artifacts"] if item["name"] == "bugreport")
+        assert bugreport["status"] == "collected"
+
+
+def test_main_kills_background_bugreport_when_collection_fails(tmp_path, monkeypatch):
+    args = build_args(tmp_path, simplified=False, include_bugreport=True)
+    logger = logging.getLogger("test_cli_bugreport_cancel")
+    bugreport = SimpleNamespace(terminated=False)
+    bugreport.wait = lambda: None
+    bugreport.terminate = lambda: setattr(bugreport, "terminated", True)
+
+    class BackgroundBugreportADBClient(FakeADBClient):
+        def start_bugreport(self, output_path, device=None):
+            return bugreport
+
+    def fail_collect_logs(*_args, **_kwargs):
+        raise AdbTimeoutError("ADB command timed out after 60.0 seconds.", ["adb"], 60.0)
+
+    monkeypatch.setattr(cli, "collect_logs", fail_collect_logs)
+
+    exit_code = main(
+        args, logger=logger, client=BackgroundBugreportADBClient(), prompt=lambda _: "summary"
+    )
+
+    assert exit_code == 5
+    assert bugreport.terminated is True
+
+
 def test_main_returns_clear_error_when_no_devices_found(tmp_path, caplog):
     args = build_args(tmp_path)
     logger = logging.getLogger("test_cli_no_device")
@@ -446,6 +503,83 @@ def test_main_fails_in_non_interactive_mode_without_device_choice(tmp_path, capl
     )
 
 
+def test_main_fails_fast_with_multiple_devices_when_stdin_is_not_interactive(
+    tmp_path, caplog, monkeypatch
+):
+    args = build_args(tmp_path)
+    logger = logging.getLogger("test_cli_non_tty_device_failure")
+    monkeypatch.setattr("sys.stdin", io.StringIO())
+
+    with caplog.at_level(logging.ERROR, logger=logger.name):
+        exit_code = main(
+            args=args,
+            logger=logger,
+            client=MultiDeviceADBClient(),
+            prompt=lambda _: "unused",
+            require_tty=True,
+        )
+
+    assert exit_code == 8
+    assert "stdin is not interactive. Pass --device or --all-devices." in caplog.text
+
+
+def test_main_rejects_all_devices_with_device_before_listing_devices(tmp_path, caplog):
+    args = build_args(tmp_path, all_devices=True, device="emulator-5554")
+    logger = logging.getLogger("test_cli_all_devices_conflict")
+
+    class UnreachableADBClient(FakeADBClient):
+        def list_devices(self):
+            raise AssertionError("devices should not be listed for invalid flags")
+
+    with caplog.at_level(logging.ERROR, logger=logger.name):
+        exit_code = main(
+            args=args,
+            logger=logger,
+            client=UnreachableADBClient(),
+            prompt=lambda _: "unused",
+        )
+
+    assert exit_code == 8
+    assert "--all-devices cannot be combined with --device." in caplog.text
+
+
+def test_run_collects_every_device_into_its_own_report_with_all_devices(tmp_path, caplog):
+    args = build_args(tmp_path, all_devices=True, incident_summary="fleet summary")
+    logger = logging.getLogger("test_cli_all_devices")
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        exit_code = run(
+            args,
+            logger,
+            client=MultiDeviceADBClient(),
+            prompt=lambda _: "unused",
+            device_prompt=lambda _: "unused",
+        )
+
+    assert exit_code == 0
+    assert "[emulator-5554] Collecting logcat..." in caplog.messages
+    assert "[device-1234] Collecting logcat..." in caplog.messages
+
+    for serial in ("emulator-5554", "device-1234"):
+        zip_files = list((tmp_path / "output" / serial).glob("QA_bug_report_*.zip"))
+        assert len(zip_files) == 1
+
+        with ZipFile(zip_files[0]) as archive:
+            metadata = json.loads(archive.read("metadata.json").decode("utf-8"))
+            assert metadata["device"] == serial
+            assert metadata["incident_summary"] == "fleet summary"
+            assert metadata["selected_options"]["all_devices"] is True
+
+
+def test_run_accepts_namespaces_without_all_devices(tmp_path):
+    args = build_args(tmp_path, incident_summary="library caller")
+    del args.all_devices
+
+    exit_code = run(args, logging.getLogger("test_cli_legacy_namespace"), client=FakeADBClient())
+
+    assert exit_code == 0
+
+
 def test_run_returns_error_code_when_fail_on_partial_is_enabled(tmp_path):
     args = build_args(tmp_path, fail_on_partial=True)
     logger = logging.getLogger("test_cli_fail_on_partial")
@@ -1,11 +1,23 @@
 """Unit tests for the ADB abstraction layer."""
 
+import io
+import os
+import queue
+import re
+import shlex
 import subprocess
+import tarfile
+import threading
 
 import pytest
 
-from adb_bug_report_generator.adb import ADBClient, DeviceRecord
+from adb_bug_report_generator.adb import ADBClient, AdbShellSession, DeviceRecord
+from adb_bug_report_generator.collector import (
+    APPLICATION_DIRECTORIES,
+    build_directory_probe_command,
+)
 from adb_bug_report_generator.exceptions import (
+    AdbCommandError,
     DeviceAuthorizationError,
     DeviceUnavailableError,
     InvalidDeviceSelectionError,
@@ -116,7 +128,7 @@ def test_run_shell_command_returns_result_on_non_zero_exit_when_allowed(monkeypa
     def fake_run(*_args, **_kwargs):
         error = subprocess.CalledProcessError(
             returncode=1,
-            cmd=["adb", "shell", "sh", "-c", "test -d '/missing' && echo exists"],
+            cmd=["adb", "shell", "test -d '/missing' && echo exists"],
             stderr="",
         )
         error.stdout = ""
@@ -147,10 +159,55 @@ def test_run_shell_command_quotes_remote_command_as_single_argument(monkeypatch)
     assert captured["args"] == [
         "adb",
         "shell",
-        "sh -c 'getprop ro.product.model'",
+        "getprop ro.product.model",
     ]
 
 
+def test_run_shell_command_strips_ansi_color_codes(monkeypatch):
+    client = ADBClient()
+
+    def fake_run(args, **_kwargs):
+        return _completed_process(args, stdout="\x1b[1;32mPixel 8\x1b[0m\n")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    assert client.run_shell_command("getprop ro.product.model").stdout == "Pixel 8"
+
+
+def test_stream_shell_command_to_file_writes_stdout_to_disk(monkeypatch, tmp_path):
+    client = ADBClient()
+    output_path = tmp_path / "logcat.txt"
+
+    def fake_run(args, **kwargs):
+        kwargs["stdout"].write(b"fake logcat\n")
+        return _completed_process(args, stdout=None)
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    result = client.stream_shell_command_to_file("logcat -d", output_path, device="device-1234")
+
+    assert result.command == ("adb", "-s", "device-1234", "exec-out", "{ logcat -d; } 2>/dev/null")
+    assert result.stdout == ""
+    assert output_path.read_bytes() == b"fake logcat\n"
+
+
+def test_stream_shell_command_to_file_avoids_pty_line_endings_on_legacy_adbd(monkeypatch, tmp_path):
+    client = ADBClient()
+    output_path = tmp_path / "battery_info.txt"
+
+    def fake_run(args, **kwargs):
+        # Pre-shell_v2 adbd runs ``shell:`` services under a PTY, which emits CRLF.
+        line_ending = b"\r\n" if "shell" in args else b"\n"
+        kwargs["stdout"].write(b"level: 80" + line_ending + b"status: 2" + line_ending)
+        return _completed_process(args, stdout=None)
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    client.stream_shell_command_to_file("dumpsys battery", output_path, device="device-legacy")
+
+    assert output_path.read_bytes() == b"level: 80\nstatus: 2\n"
+
+
 def test_collect_bugreport_disables_command_timeout(monkeypatch, tmp_path):
     client = ADBClient(timeout_seconds=60.0)
     captured = {}
@@ -174,6 +231,297 @@ def test_collect_bugreport_disables_command_timeout(monkeypatch, tmp_path):
     assert captured["timeout"] is None
 
 
+def test_pull_directory_disables_command_timeout(monkeypatch, tmp_path):
+    client = ADBClient(timeout_seconds=60.0)
+    captured = {}
+
+    def fake_run(args, **kwargs):
+        captured["args"] = args
+        captured["timeout"] = kwargs["timeout"]
+        return _completed_process(args)
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    client.pull_directory("/sdcard/Pictures", tmp_path, device="device-1234")
+
+    assert captured["args"] == [
+        "adb",
+        "-s",
+        "device-1234",
+        "pull",
+        "/sdcard/Pictures",
+        str(tmp_path),
+    ]
+    assert captured["timeout"] is None
+
+
+def test_start_bugreport_runs_killable_background_process(monkeypatch, tmp_path):
+    client = ADBClient(timeout_seconds=60.0)
+    processes = []
+
+    class FakePopen:
+        def __init__(self, args, **_kwargs):
+            self.args = args
+            self.returncode = None
+            processes.append(self)
+
+        def poll(self):
+            return self.returncode
+
+        def kill(self):
+            self.returncode = -9
+
+        def communicate(self):
+            return b"", b""
+
+    monkeypatch.setattr(subprocess, "Popen", FakePopen)
+
+    command = client.start_bugreport(tmp_path / "bugreport.zip", device="device-1234")
+    command.terminate()
+
+    assert processes[0].args == [
+        "adb",
+        "-s",
+        "device-1234",
+        "bugreport",
+        str(tmp_path / "bugreport.zip"),
+    ]
+    assert processes[0].returncode == -9
+
+
+def test_stream_files_extracts_requested_members_from_tar_stream(monkeypatch, tmp_path):
+    client = ADBClient()
+    captured = {}
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        for name, payload in (("./screen-001.mp4", b"video"), ("./unexpected.txt", b"extra")):
+            info = tarfile.TarInfo(name)
+            info.size = len(payload)
+            archive.addfile(info, io.BytesIO(payload))
+
+    class FakePopen:
+        def __init__(self, args, **_kwargs):
+            captured["args"] = args
+            self.stdout = io.BytesIO(buffer.getvalue())
+            self.stderr = io.BytesIO(b"")
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc_info):
+            return False
+
+        def kill(self):
+            pass
+
+    monkeypatch.setattr(subprocess, "Popen", FakePopen)
+
+    written = client.stream_files(
+        "/sdcard/Movies",
+        {
+            "screen-001.mp4": tmp_path / "screen-001.mp4",
+            "screen-002.mp4": tmp_path / "screen-002.mp4",
+        },
+        device="device-1234",
+    )
+
+    assert written == {"screen-001.mp4"}
+    assert (tmp_path / "screen-001.mp4").read_bytes() == b"video"
+    assert not (tmp_path / "unexpected.txt").exists()
+    assert captured["args"] == [
+        "adb",
+        "-s",
+        "device-1234",
+        "exec-out",
+        "tar -cf - -C /sdcard/Movies ./screen-001.mp4 ./screen-002.mp4 2>/dev/null",
+    ]
+
+
+def test_stream_files_keeps_completed_members_when_stream_stalls(monkeypatch, tmp_path):
+    client = ADBClient(timeout_seconds=0.05)
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        for name, payload in (("./screen-001.mp4", b"video"), ("./screen-002.mp4", b"x" * 1000)):
+            info = tarfile.TarInfo(name)
+            info.size = len(payload)
+            archive.addfile(info, io.BytesIO(payload))
+    read_fd, write_fd = os.pipe()
+    # The first member, then the header and part of the second before the stream stalls.
+    os.write(write_fd, buffer.getvalue()[: 512 * 3 + 100])
+
+    class StallingPopen:
+        def __init__(self, args, **_kwargs):
+            self.stdout = os.fdopen(read_fd, "rb")
+            self.killed = False
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc_info):
+            self.stdout.close()
+            return False
+
+        def kill(self):
+            if not self.killed:
+                self.killed = True
+                os.close(write_fd)
+
+    monkeypatch.setattr(subprocess, "Popen", StallingPopen)
+
+    written = client.stream_files(
+        "/sdcard/Movies",
+        {
+            "screen-001.mp4": tmp_path / "screen-001.mp4",
+            "screen-002.mp4": tmp_path / "screen-002.mp4",
+        },
+    )
+
+    assert written == {"screen-001.mp4"}
+    assert (tmp_path / "screen-001.mp4").read_bytes() == b"video"
+    assert not (tmp_path / "screen-002.mp4").exists()
+
+
+def _run_and_swallow(thread):
+    """Run a thread target without letting its exception reach ``threading.excepthook``."""
+    try:
+        thread._target(*thread._args, **thread._kwargs)
+    except Exception:
+        pass
+
+
+class FakeShellProcess:
+    """Minimal stand-in for a persistent ``adb shell`` process."""
+
+    instances = []
+
+    def __init__(self, args, **_kwargs):
+        self.args = args
+        self.commands = []
+        self.closed = False
+        self._lines = queue.Queue()
+        self.stdin = self
+        self.stdout = iter(self._lines.get, None)
+        FakeShellProcess.instances.append(self)
+
+    def write(self, text):
+        command = shlex.split(text)[2]
+        sentinel = re.search(r"echo (\S+)\$__rc", text).group(1)
+        self.commands.append(command)
+        responses = {
+            "getprop ro.product.model": ("Pixel 8\n", 0),
+            "test -d /missing": ("", 1),
+        }
+        stdout, returncode = responses.get(command, ("", 0))
+        for line in (stdout + "\n").splitlines(keepends=True):
+            self._lines.put(line)
+        self._lines.put(f"{sentinel}{returncode}\n")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+        self._lines.put(None)
+
+    def wait(self, timeout=None):
+        return 0
+
+
+def _features_run(features):
+    def fake_run(args, **_kwargs):
+        if args[-1] == "features":
+            return _completed_process(args, stdout=features)
+        raise AssertionError("one-shot adb should not be spawned")
+
+    return fake_run
+
+
+def test_persistent_shell_reuses_one_adb_process(monkeypatch):
+    FakeShellProcess.instances.clear()
+    client = ADBClient(persistent_shell=True)
+    monkeypatch.setattr(subprocess, "Popen", FakeShellProcess)
+    fail_run = _features_run("cmd\nshell_v2\nstat_v2\n")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
+
+    model = client.run_shell_command("getprop ro.product.model", device="device-1234")
+    missing = client.run_shell_command("test -d /missing", device="device-1234", allow_failure=True)
+    client.close()
+
+    assert len(FakeShellProcess.instances) == 1
+    process = FakeShellProcess.instances[0]
+    assert process.args == ["adb", "-s", "device-1234", "shell"]
+    assert process.commands == ["getprop ro.product.model", "test -d /missing"]
+    assert process.closed is True
+    assert model.stdout == "Pixel 8"
+    assert model.command == ("adb", "-s", "device-1234", "shell", "getprop ro.product.model")
+    assert (missing.stdout, missing.returncode) == ("", 1)
+
+
+def test_persistent_shell_reruns_failures_as_one_shot_for_error_details(monkeypatch):
+    client = ADBClient(persistent_shell=True)
+    monkeypatch.setattr(subprocess, "Popen", FakeShellProcess)
+
+    def fake_run(args, **_kwargs):
+        if args[-1] == "features":
+            return _completed_process(args, stdout="shell_v2\n")
+        raise subprocess.CalledProcessError(
+            returncode=1, cmd=args, stderr="error: device offline", output=""
+        )
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    with pytest.raises(DeviceUnavailableError):
+        client.run_shell_command("test -d /missing", device="device-1234")
+    client.close()
+
+
+def test_persistent_shell_falls_back_to_one_shot_without_shell_v2(monkeypatch):
+    FakeShellProcess.instances.clear()
+    client = ADBClient(persistent_shell=True)
+    monkeypatch.setattr(subprocess, "Popen", FakeShellProcess)
+    calls = []
+
+    def fake_run(args, **_kwargs):
+        calls.append(args)
+        if args[-1] == "features":
+            return _completed_process(args, stdout="cmd\nstat_v2\n")
+        return _completed_process(args, stdout="23\r\n")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    first = client.run_shell_command("getprop ro.build.version.sdk", device="device-1234")
+    client.run_shell_command("getprop ro.product.model", device="device-1234")
+    client.close()
+
+    assert FakeShellProcess.instances == []
+    assert first.stdout == "23"
+    assert [args[-1] for args in calls] == [
+        "features",
+        "getprop ro.build.version.sdk",
+        "getprop ro.product.model",
+    ]
+
+
+def test_shell_session_reports_end_when_stdout_reader_fails(monkeypatch):
+    class BrokenStdoutProcess(FakeShellProcess):
+        def __init__(self, args, **kwargs):
+            super().__init__(args, **kwargs)
+            self.stdout = self._broken_lines()
+
+        def _broken_lines(self):
+            yield from ()
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+    monkeypatch.setattr(subprocess, "Popen", BrokenStdoutProcess)
+    monkeypatch.setattr(threading.Thread, "run", _run_and_swallow)
+
+    session = AdbShellSession(["adb", "shell"])
+
+    with pytest.raises(AdbCommandError, match="ended unexpectedly"):
+        session.run("getprop ro.product.model")
+
+
 class FakeProfileClient(ADBClient):
     def run_shell_command(self, command, device=None, allow_failure=False):
         responses = {
@@ -192,16 +540,14 @@ class FakeProfileClient(ADBClient):
             "command -v ifconfig >/dev/null 2>&1 && echo available": "",
             "command -v ip >/dev/null 2>&1 && echo available": "available",
             "command -v top >/dev/null 2>&1 && echo available": "available",
-            (
-                "test -d '/sdcard/Android/data/org.mavlink.qgroundcontrol/files/PDW_GCS' "
-                "&& echo exists"
-            ): "",
-            "test -d '/sdcard/Android/data/ai.pdw.gcs/files/PDW_GCS' && echo exists": "exists",
+            build_directory_probe_command(APPLICATION_DIRECTORIES): (
+                "/sdcard/Android/data/ai.pdw.gcs/files/PDW_GCS"
+            ),
         }
         from adb_bug_report_generator.adb import ADBCommandResult
 
         return ADBCommandResult(
-            command=("adb", "shell", "sh", "-c", command),
+            command=("adb", "shell", command),
             stdout=responses.get(command, ""),
             stderr="",
             returncode=0,
@@ -1,5 +1,7 @@
 """Unit tests for collector helpers."""
 
+import threading
+from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
@@ -11,11 +13,15 @@ from adb_bug_report_generator.collector import (
     collect_protected_path_diagnostics,
     evaluate_requested_collectors,
     filter_log_specs,
+    get_application_directories,
+    list_recent_files,
+    pull_directory,
+    pull_recent_files,
     resolve_log_specs_for_profile,
     select_device,
 )
 from adb_bug_report_generator.compatibility import DeviceProfile
-from adb_bug_report_generator.exceptions import DeviceSelectionError
+from adb_bug_report_generator.exceptions import AdbTimeoutError, DeviceSelectionError
 from tests import _bootstrap  # noqa: F401
 
 
@@ -369,3 +375,349 @@ def test_collect_logs_uses_legacy_android_fallback_commands(tmp_path):
     assert "top -n 1 -m 10" in commands_seen
     assert "df" in commands_seen
     assert "dumpsys activity activities" in commands_seen
+
+
+def test_pull_recent_files_reports_concurrent_pulls_in_listing_order(tmp_path):
+    class FakeClient:
+        def shell_text(self, command, device=None):
+            return "c.log\nb.log\na.log"
+
+        def pull_file(self, remote_path, local_path, device=None):
+            if remote_path.endswith("b.log"):
+                raise RuntimeError("simulated pull failure")
+            local_path.write_text(remote_path, encoding="utf-8")
+
+    captured = []
+    report_paths = SimpleNamespace(navsuite_log_dir=tmp_path)
+
+    results = pull_recent_files(
+        FakeClient(),
+        "/sdcard/Documents/Navsuite",
+        "ls -t /sdcard/Documents/Navsuite",
+        tmp_path,
+        3,
+        "device-1234",
+        report_paths,
+        output=captured.append,
+    )
+
+    assert [result.name for result in results] == [
+        "pull:/sdcard/Documents/Navsuite/c.log",
+        "pull:/sdcard/Documents/Navsuite/b.log",
+        "pull:/sdcard/Documents/Navsuite/a.log",
+    ]
+    assert [result.status for result in results] == ["collected", "failed", "collected"]
+    assert captured[2] == "Failed to pull file /sdcard/Documents/Navsuite/b.log"
+    assert (tmp_path / "a.log").exists()
+
+
+def test_pull_directory_uses_single_pull_when_nothing_is_excluded(tmp_path):
+    pulled = []
+
+    class FakeClient:
+        def shell_text(self, command, device=None):
+            return "photo-001.jpg\nScreenshots/"
+
+        def pull_directory(self, remote_path, local_dir, device=None):
+            pulled.append((remote_path, local_dir))
+
+        def pull_file(self, remote_path, local_path, device=None):
+            pulled.append((remote_path, local_path))
+
+    results = pull_directory(FakeClient(), "/sdcard/Pictures", tmp_path, "device-1234")
+
+    assert pulled == [("/sdcard/Pictures", tmp_path)]
+    assert [(result.name, result.status) for result in results] == [
+        ("pull:/sdcard/Pictures", "collected")
+    ]
+
+
+def test_pull_directory_removes_hidden_entries_missing_from_listing(tmp_path):
+    class FakeClient:
+        def shell_text(self, command, device=None):
+            return "photo-001.jpg\nScreenshots/"
+
+        def pull_directory(self, remote_path, local_dir, device=None):
+            pulled_dir = Path(local_dir) / "Pictures"
+            for relative in (
+                "photo-001.jpg",
+                ".thumbnails/photo-001.jpg",
+                ".pending-photo.jpg",
+                "Screenshots/shot.png",
+                "Screenshots/.thumbnails/shot.png",
+            ):
+                (pulled_dir / relative).parent.mkdir(parents=True, exist_ok=True)
+                (pulled_dir / relative).write_bytes(b"data")
+
+    pull_directory(FakeClient(), "/sdcard/Pictures", tmp_path, "device-1234")
+
+    remaining = sorted(
+        path.relative_to(tmp_path / "Pictures").as_posix()
+        for path in (tmp_path / "Pictures").rglob("*")
+    )
+    assert remaining == ["Screenshots", "Screenshots/shot.png", "photo-001.jpg"]
+
+
+def test_pull_directory_falls_back_to_item_pulls_when_whole_pull_times_out(tmp_path):
+    pulled = []
+
+    class FakeClient:
+        def shell_text(self, command, device=None):
+            return "photo-001.jpg\nScreenshots/"
+
+        def pull_directory(self, remote_path, local_dir, device=None):
+            partial = Path(local_dir) / "Pictures" / ".thumbnails"
+            partial.mkdir(parents=True)
+            (partial / "photo-001.jpg").write_bytes(b"partial")
+            raise AdbTimeoutError("ADB command timed out after 60.0 seconds.", ["adb"], 60.0)
+
+        def pull_file(self, remote_path, local_path, device=None):
+            pulled.append(remote_path)
+            Path(local_path).write_bytes(b"data")
+
+    results = pull_directory(FakeClient(), "/sdcard/Pictures", tmp_path, "device-1234")
+
+    assert sorted(pulled) == ["/sdcard/Pictures/Screenshots", "/sdcard/Pictures/photo-001.jpg"]
+    assert [result.status for result in results] == ["collected", "collected"]
+    assert sorted(path.name for path in (tmp_path / "Pictures").iterdir()) == [
+        "Screenshots",
+        "photo-001.jpg",
+    ]
+
+
+def test_pull_directory_pulls_items_individually_when_entries_are_excluded(tmp_path):
+    pulled = []
+
+    class FakeClient:
+        def shell_text(self, command, device=None):
+            return ".thumbnails/\nphoto-001.jpg"
+
+        def pull_file(self, remote_path, local_path, device=None):
+            pulled.append(remote_path)
+
+    results = pull_directory(FakeClient(), "/sdcard/Pictures", tmp_path, "device-1234")
+
+    assert pulled == ["/sdcard/Pictures/photo-001.jpg"]
+    assert results[0].path == str(tmp_path / "Pictures" / "photo-001.jpg")
+
+
+def test_pull_recent_files_streams_with_tar_and_pulls_missing_files(tmp_path):
+    pulled = []
+
+    class FakeClient:
+        def shell_text(self, command, device=None):
+            return "b.log\na.log"
+
+        def stream_files(self, remote_dir, targets, device=None):
+            targets["b.log"].write_text("streamed", encoding="utf-8")
+            return {"b.log"}
+
+        def pull_file(self, remote_path, local_path, device=None):
+            pulled.append(remote_path)
+
+    results = pull_recent_files(
+        FakeClient(),
+        "/sdcard/Documents/Navsuite",
+        "ls -t /sdcard/Documents/Navsuite",
+        tmp_path,
+        2,
+        "device-1234",
+        SimpleNamespace(navsuite_log_dir=tmp_path),
+        use_archive=True,
+    )
+
+    assert pulled == ["/sdcard/Documents/Navsuite/a.log"]
+    assert [result.status for result in results] == ["collected", "collected"]
+    assert (tmp_path / "b.log").read_text(encoding="utf-8") == "streamed"
+
+
+def test_collect_logs_runs_commands_concurrently_and_keeps_spec_order(tmp_path):
+    storage_started = threading.Event()
+
+    class FakeClient:
+        def shell_text(self, command, device=None):
+            if command == "df -h":
+                storage_started.set()
+                return "storage info"
+            # The first log only completes once the second one has started running.
+            return "cpu usage" if storage_started.wait(timeout=5) else ""
+
+    profile = DeviceProfile(
+        serial="device-1234",
+        model="Pixel",
+        manufacturer="Google",
+        android_version="14",
+        sdk_level=34,
+        is_emulator=False,
+        is_boot_completed=True,
+        is_rooted=False,
+        accessible_paths=(),
+        available_commands={"top": True},
+    )
+
+    results = collect_logs(
+        FakeClient(),
+        "device-1234",
+        SimpleNamespace(device_info_dir=tmp_path),
+        profile,
+        log_specs=(
+            ("cpu_usage", "cpu_usage.txt", ("top -n 1",), "top"),
+            ("storage_info", "storage_info.txt", ("df -h",), "df"),
+        ),
+    )
+
+    assert [(result.name, result.status) for result in results] == [
+        ("cpu_usage", "collected"),
+        ("storage_info", "collected"),
+    ]
+    assert (tmp_path / "cpu_usage.txt").read_text(encoding="utf-8") == "cpu usage"
+
+
+def test_get_application_directories_probes_all_paths_in_one_shell_call():
+    commands_seen = []
+
+    class FakeClient:
+        def shell_text(self, command, device=None):
+            commands_seen.append(command)
+            return "/sdcard/b dir\n"
+
+    found = get_application_directories(
+        FakeClient(), "device-1234", directories=("/sdcard/a", "/sdcard/b dir")
+    )
+
+    assert found == ["/sdcard/b dir"]
+    assert commands_seen == [
+        'for d in /sdcard/a \'/sdcard/b dir\'; do [ -d "$d" ] && echo "$d"; done'
+    ]
+
+
+def test_collect_logs_streams_large_log_bytes_and_keeps_small_outputs_as_text(tmp_path):
+    streamed = []
+    buffered = []
+
+    class FakeClient:
+        def stream_shell_command_to_file(self, command, output_path, device=None, **_kwargs):
+            streamed.append(command)
+            payloads = {"dumpsys activity": b"activity dump"}
+            output_path.write_bytes(payloads.get(command, b""))
+
+        def shell_text(self, command, device=None):
+            # Stands in for run_shell_command, which strips ANSI escapes from small outputs.
+            buffered.append(command)
+            return "storage" if command == "df" else ""
+
+    profile = DeviceProfile(
+        serial="device-legacy",
+        model="Pixel",
+        manufacturer="Google",
+        android_version="6.0",
+        sdk_level=23,
+        is_emulator=False,
+        is_boot_completed=True,
+        is_rooted=False,
+        accessible_paths=(),
+        available_commands={"dumpsys": True},
+    )
+
+    results = collect_logs(
+        FakeClient(),
+        "device-legacy",
+        SimpleNamespace(device_info_dir=tmp_path),
+        profile,
+        log_specs=(
+            ("event_logs", "event_logs.txt", ("dumpsys activity",), "dumpsys"),
+            ("storage_info", "storage_info.txt", ("df -h",), "df"),
+        ),
+    )
+
+    assert sorted(streamed) == ["dumpsys activity", "dumpsys activity activities"]
+    assert buffered == ["df"]
+    assert [result.status for result in results] == ["collected", "collected"]
+    assert results[0].detail == "Collected using `dumpsys activity`."
+    assert (tmp_path / "event_logs.txt").read_bytes() == b"activity dump"
+    assert (tmp_path / "storage_info.txt").read_text(encoding="utf-8") == "storage"
+
+
+def test_collect_logs_falls_back_when_streamed_output_is_only_whitespace(tmp_path):
+    class FakeClient:
+        def stream_shell_command_to_file(self, command, output_path, device=None, **_kwargs):
+            payloads = {"getprop": b"\n \n", "dumpsys window": b"window dump\n"}
+            output_path.write_bytes(payloads[command])
+
+    profile = DeviceProfile(
+        serial="device-1234",
+        model="Pixel",
+        manufacturer="Google",
+        android_version="14",
+        sdk_level=34,
+        is_emulator=False,
+        is_boot_completed=True,
+        is_rooted=False,
+        accessible_paths=(),
+        available_commands={"getprop": True, "dumpsys": True},
+    )
+
+    results = collect_logs(
+        FakeClient(),
+        "device-1234",
+        SimpleNamespace(device_info_dir=tmp_path),
+        profile,
+        log_specs=(
+            (
+                "device_info",
+                "device_info.txt",
+                ("getprop", "dumpsys window"),
+                "getprop_or_dumpsys",
+            ),
+        ),
+    )
+
+    assert results[0].detail == "Collected using `dumpsys window`."
+    assert (tmp_path / "device_info.txt").read_bytes() == b"window dump\n"
+
+
+def test_list_recent_files_lists_every_directory_in_one_shell_call():
+    commands_seen = []
+
+    class FakeClient:
+        def shell_text(self, command, device=None):
+            commands_seen.append(command)
+            return (
+                "__adb_bug_report_listing__:/sdcard/Movies\n"
+                "screen-002.mp4\n"
+                "screen-001.mp4\n"
+                "__adb_bug_report_listing__:/sdcard/Documents/Navsuite"
+            )
+
+    listings = list_recent_files(
+        FakeClient(),
+        [
+            ("/sdcard/Movies", "ls -t /sdcard/Movies | grep '^screen-'"),
+            ("/sdcard/Documents/Navsuite", "ls -t /sdcard/Documents/Navsuite"),
+        ],
+        2,
+        "device-1234",
+    )
+
+    assert listings == {
+        "/sdcard/Movies": "screen-002.mp4\nscreen-001.mp4",
+        "/sdcard/Documents/Navsuite": "",
+    }
+    assert commands_seen == [
+        "echo __adb_bug_report_listing__:/sdcard/Movies; "
+        "ls -t /sdcard/Movies | grep '^screen-' | head -n 2; "
+        "echo __adb_bug_report_listing__:/sdcard/Documents/Navsuite; "
+        "ls -t /sdcard/Documents/Navsuite | head -n 2"
+    ]
+
+
+def test_list_recent_files_returns_none_when_batched_listing_is_unavailable():
+    class FakeClient:
+        def shell_text(self, command, device=None):
+            return ""
+
+    listings = list_recent_files(
+        FakeClient(), [("/sdcard/Movies", "ls -t /sdcard/Movies")], 2, "device-1234"
+    )
+
+    assert listings is None
@@ -1,6 +1,10 @@
 """Unit tests for device compatibility detection."""
 
 from adb_bug_report_generator.adb import ADBCommandResult
+from adb_bug_report_generator.collector import (
+    APPLICATION_DIRECTORIES,
+    build_directory_probe_command,
+)
 from adb_bug_report_generator.compatibility import detect_accessible_paths, detect_device_profile
 from tests import _bootstrap  # noqa: F401
 
@@ -23,11 +27,9 @@ class FakeProfileClient:
             "command -v ifconfig >/dev/null 2>&1 && echo available": "",
             "command -v ip >/dev/null 2>&1 && echo available": "available",
             "command -v top >/dev/null 2>&1 && echo available": "available",
-            (
-                "test -d '/sdcard/Android/data/org.mavlink.qgroundcontrol/files/PDW_GCS' "
-                "&& echo exists"
-            ): "",
-            "test -d '/sdcard/Android/data/ai.pdw.gcs/files/PDW_GCS' && echo exists": "exists",
+            build_directory_probe_command(APPLICATION_DIRECTORIES): (
+                "/sdcard/Android/data/ai.pdw.gcs/files/PDW_GCS"
+            ),
         }
         return responses.get(command, "")
 
@@ -51,18 +53,14 @@ def test_detect_device_profile_collects_capabilities():
 class ProbeFriendlyClient:
     def run_shell_command(self, command, device=None, allow_failure=False):
         responses = {
-            (
-                "test -d '/sdcard/Android/data/org.mavlink.qgroundcontrol/files/PDW_GCS' "
-                "&& echo exists"
-            ): ("", 1),
-            "test -d '/sdcard/Android/data/ai.pdw.gcs/files/PDW_GCS' && echo exists": (
-                "exists",
-                0,
+            build_directory_probe_command(APPLICATION_DIRECTORIES): (
+                "/sdcard/Android/data/ai.pdw.gcs/files/PDW_GCS",
+                1,
             ),
         }
         stdout, returncode = responses.get(command, ("", 1))
         return ADBCommandResult(
-            command=("adb", "shell", "sh", "-c", command),
+            command=("adb", "shell", command),
             stdout=stdout,
             stderr="",
             returncode=returncode,
@@ -1,12 +1,14 @@
 """Unit tests for filesystem helpers."""
 
+import zipfile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
 from adb_bug_report_generator.filesystem import (
     create_report_paths,
     create_zip_archive,
     sanitize_filename_component,
     sanitize_metadata_text,
     validate_output_root,
-    write_json_file,
 )
 from tests import _bootstrap  # noqa: F401
 
@@ -27,7 +29,7 @@ def test_create_zip_archive_writes_metadata_and_files(tmp_path):
     source_dir.mkdir()
     sample_file = source_dir / "device_info.txt"
     sample_file.write_text("hello", encoding="utf-8")
-    write_json_file(source_dir / "metadata.json", {"status": "ok"})
+    (source_dir / "metadata.json").write_text('{"status": "ok"}', encoding="utf-8")
 
     zip_path = tmp_path / "report.zip"
     create_zip_archive(source_dir, zip_path)
@@ -36,6 +38,96 @@ def test_create_zip_archive_writes_metadata_and_files(tmp_path):
     assert (source_dir / "metadata.json").exists()
 
 
+def test_create_zip_archive_preserves_nested_file_contents(tmp_path):
+    source_dir = tmp_path / "report"
+    nested_dir = source_dir / "Device Info"
+    nested_dir.mkdir(parents=True)
+    payload = b"logcat line\n" * 200_000
+    (nested_dir / "logcat.txt").write_bytes(payload)
+
+    zip_path = tmp_path / "report.zip"
+    create_zip_archive(source_dir, zip_path)
+
+    with ZipFile(zip_path) as archive:
+        assert archive.namelist() == ["Device Info/logcat.txt"]
+        assert archive.read("Device Info/logcat.txt") == payload
+        assert archive.testzip() is None
+
+
+def test_create_zip_archive_writes_extra_entries_without_touching_source_dir(tmp_path):
+    source_dir = tmp_path / "report"
+    source_dir.mkdir()
+    (source_dir / "device_info.txt").write_text("hello", encoding="utf-8")
+
+    zip_path = tmp_path / "report.zip"
+    create_zip_archive(source_dir, zip_path, extra_entries={"metadata.json": '{"status": "ok"}'})
+
+    with ZipFile(zip_path) as archive:
+        assert archive.read("metadata.json") == b'{"status": "ok"}'
+        metadata_info = archive.getinfo("metadata.json")
+        assert metadata_info.external_attr >> 16 == 0o100644
+        assert metadata_info.compress_type == ZIP_DEFLATED
+        assert "device_info.txt" in archive.namelist()
+    assert not (source_dir / "metadata.json").exists()
+
+
+def test_create_zip_archive_includes_every_nested_file(tmp_path):
+    source_dir = tmp_path / "report"
+    (source_dir / "Screen Recordings").mkdir(parents=True)
+    (source_dir / "run_notes.txt").write_text("x", encoding="utf-8")
+    (source_dir / "Screen Recordings" / "screen-001.mp4").write_bytes(b"v" * 4096)
+    (source_dir / "device_info.txt").write_text("x" * 64, encoding="utf-8")
+
+    zip_path = tmp_path / "report.zip"
+    create_zip_archive(source_dir, zip_path)
+
+    with ZipFile(zip_path) as archive:
+        assert sorted(archive.namelist()) == [
+            "Screen Recordings/screen-001.mp4",
+            "device_info.txt",
+            "run_notes.txt",
+        ]
+        assert archive.getinfo("device_info.txt").file_size == 64
+
+
+def test_create_zip_archive_stores_already_compressed_media(tmp_path):
+    source_dir = tmp_path / "report"
+    source_dir.mkdir()
+    (source_dir / "screen-001.MP4").write_bytes(b"video")
+    (source_dir / "bugreport.zip").write_bytes(b"archive")
+    (source_dir / "logcat.txt").write_text("log", encoding="utf-8")
+
+    zip_path = tmp_path / "report.zip"
+    create_zip_archive(source_dir, zip_path)
+
+    with ZipFile(zip_path) as archive:
+        compress_types = {info.filename: info.compress_type for info in archive.infolist()}
+
+    assert compress_types == {
+        "screen-001.MP4": ZIP_STORED,
+        "bugreport.zip": ZIP_STORED,
+        "logcat.txt": ZIP_DEFLATED,
+    }
+
+
+def test_create_zip_archive_uses_fast_deflate_level(tmp_path, monkeypatch):
+    source_dir = tmp_path / "report"
+    source_dir.mkdir()
+    (source_dir / "logcat.txt").write_text("log line\n" * 100, encoding="utf-8")
+    levels = []
+    original_compressobj = zipfile.zlib.compressobj
+
+    def recording_compressobj(level, *args, **kwargs):
+        levels.append(level)
+        return original_compressobj(level, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.zlib, "compressobj", recording_compressobj)
+
+    create_zip_archive(source_dir, tmp_path / "report.zip", extra_entries={"metadata.json": "{}"})
+
+    assert levels == [1, 1]
+
+
 def test_sanitize_filename_component_removes_path_traversal_and_symbols():
     assert sanitize_filename_component("../bad:name?.txt") == "bad_name_.txt"
 